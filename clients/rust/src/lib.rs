@@ -1,10 +1,17 @@
 use bytes::Bytes;
-use reqwest::{Client, StatusCode};
+use futures::stream::{self, StreamExt};
+use percent_encoding::{utf8_percent_encode, AsciiSet, NON_ALPHANUMERIC};
+use reqwest::header::{HeaderMap, HeaderName, HeaderValue};
+use reqwest::{Body, Client, RequestBuilder, Response, StatusCode};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::future::Future;
+use std::time::Duration;
 use thiserror::Error;
+use tokio::io::{AsyncWrite, AsyncWriteExt};
 
 #[derive(Error, Debug)]
+#[non_exhaustive]
 pub enum Error {
     #[error("HTTP error: {0}")]
     Http(#[from] reqwest::Error),
@@ -20,6 +27,9 @@ pub enum Error {
 
     #[error("Server error: {0}")]
     ServerError(String),
+
+    #[error("IO error: {0}")]
+    Io(#[from] std::io::Error),
 }
 
 pub type Result<T> = std::result::Result<T, Error>;
@@ -47,6 +57,47 @@ pub struct ObjectData {
     pub data: Bytes,
 }
 
+/// Custom object metadata pre-encoded as `x-object-meta-*` headers.
+///
+/// Build it once and pass it to
+/// [`ObjectStoreClient::put_object_with_headers`] to upload many objects
+/// with the same metadata without re-encoding the headers each time.
+#[derive(Debug, Clone, Default)]
+pub struct MetadataHeaders {
+    headers: HeaderMap,
+}
+
+impl MetadataHeaders {
+    pub fn new(metadata: &HashMap<String, String>) -> Result<Self> {
+        let mut headers = HeaderMap::with_capacity(metadata.len());
+
+        for (k, v) in metadata {
+            let name = HeaderName::try_from(format!("x-object-meta-{}", k))
+                .map_err(|e| Error::BadRequest(format!("Invalid metadata key {}: {}", k, e)))?;
+            let value = HeaderValue::try_from(v.as_str()).map_err(|e| {
+                Error::BadRequest(format!("Invalid metadata value for {}: {}", k, e))
+            })?;
+            headers.insert(name, value);
+        }
+
+        Ok(Self { headers })
+    }
+}
+
+/// An object whose body is being streamed from the server.
+#[derive(Debug)]
+pub struct ObjectStream {
+    pub metadata: ObjectMetadata,
+    response: Response,
+}
+
+impl ObjectStream {
+    /// Returns the next chunk of the body, or `None` once it is exhausted.
+    pub async fn chunk(&mut self) -> Result<Option<Bytes>> {
+        Ok(self.response.chunk().await?)
+    }
+}
+
 #[derive(Debug, Clone, Serialize)]
 struct CreateBucketRequest {
     name: String,
@@ -76,9 +127,218 @@ pub struct PublicUrlResponse {
     pub expires_in: u64,
 }
 
+/// Client for the object storage HTTP API.
+///
+/// Cloning is cheap: clones share the underlying connection pool, so a single
+/// client can be cloned into many tasks to issue requests concurrently.
+#[derive(Clone)]
 pub struct ObjectStoreClient {
     client: Client,
     base_url: String,
+    max_retries: u32,
+    validate_names: bool,
+}
+
+/// Builder for an [`ObjectStoreClient`] with a tuned connection pool.
+#[derive(Debug, Clone)]
+pub struct ObjectStoreClientBuilder {
+    base_url: String,
+    timeout: Option<Duration>,
+    pool_max_idle_per_host: usize,
+    pool_idle_timeout: Duration,
+    max_retries: u32,
+    http2_prior_knowledge: bool,
+    validate_names: bool,
+}
+
+impl ObjectStoreClientBuilder {
+    /// Total timeout for each request, including reading the body.
+    pub fn timeout(mut self, timeout: Duration) -> Self {
+        self.timeout = Some(timeout);
+        self
+    }
+
+    /// Maximum number of idle keep-alive connections kept per host.
+    pub fn pool_max_idle_per_host(mut self, max: usize) -> Self {
+        self.pool_max_idle_per_host = max;
+        self
+    }
+
+    /// How long an idle keep-alive connection is kept before it is closed.
+    pub fn pool_idle_timeout(mut self, timeout: Duration) -> Self {
+        self.pool_idle_timeout = timeout;
+        self
+    }
+
+    /// Number of times an idempotent request is retried after a connection
+    /// failure, a timeout or a 502/503/504 response. The delay between
+    /// attempts starts at 100ms and doubles, capped at 5s.
+    pub fn max_retries(mut self, retries: u32) -> Self {
+        self.max_retries = retries;
+        self
+    }
+
+    /// Speak HTTP/2 from the first byte instead of HTTP/1.1.
+    ///
+    /// All concurrent requests to the server are then multiplexed over a
+    /// single connection, and repeated headers are HPACK-compressed. The
+    /// server must accept HTTP/2 (plain-text `h2c` for `http://` URLs).
+    pub fn http2_prior_knowledge(mut self) -> Self {
+        self.http2_prior_knowledge = true;
+        self
+    }
+
+    /// Reject invalid bucket names and object keys locally, before any
+    /// request is sent, using the same rules as the server.
+    pub fn validate_names(mut self, validate: bool) -> Self {
+        self.validate_names = validate;
+        self
+    }
+
+    pub fn build(self) -> Result<ObjectStoreClient> {
+        let mut builder = Client::builder()
+            .pool_max_idle_per_host(self.pool_max_idle_per_host)
+            .pool_idle_timeout(self.pool_idle_timeout)
+            .tcp_nodelay(true);
+
+        if let Some(timeout) = self.timeout {
+            builder = builder.timeout(timeout);
+        }
+
+        if self.http2_prior_knowledge {
+            builder = builder.http2_prior_knowledge();
+        }
+
+        Ok(ObjectStoreClient {
+            client: builder.build()?,
+            base_url: self.base_url,
+            max_retries: self.max_retries,
+            validate_names: self.validate_names,
+        })
+    }
+}
+
+/// Characters escaped in path segments and query values (RFC 3986 unreserved are kept).
+const COMPONENT_ENCODE_SET: &AsciiSet = &NON_ALPHANUMERIC
+    .remove(b'-')
+    .remove(b'_')
+    .remove(b'.')
+    .remove(b'~');
+
+/// Object keys additionally keep `/` so nested keys map onto the wildcard route.
+const KEY_ENCODE_SET: &AsciiSet = &COMPONENT_ENCODE_SET.remove(b'/');
+
+/// Mirrors the server's bucket naming rules: 3-63 characters of lowercase
+/// letters, digits and hyphens, starting and ending with a letter or digit.
+fn validate_bucket_name(name: &str) -> Result<()> {
+    let bytes = name.as_bytes();
+    let is_alnum = |b: &u8| b.is_ascii_lowercase() || b.is_ascii_digit();
+
+    let valid = (3..=63).contains(&bytes.len())
+        && bytes.first().is_some_and(is_alnum)
+        && bytes.last().is_some_and(is_alnum)
+        && bytes.iter().all(|b| is_alnum(b) || *b == b'-');
+
+    if valid {
+        Ok(())
+    } else {
+        Err(Error::BadRequest(format!("Invalid bucket name: {}", name)))
+    }
+}
+
+/// Mirrors the server's object key rules.
+fn validate_object_key(key: &str) -> Result<()> {
+    if key.is_empty() || key.contains("..") || key.starts_with('/') || key == ".bucket" {
+        return Err(Error::BadRequest(format!("Invalid key: {}", key)));
+    }
+    Ok(())
+}
+
+/// Longest error response body kept in an error message.
+const MAX_ERROR_BODY: usize = 4096;
+
+/// Reads at most [`MAX_ERROR_BODY`] bytes of an error response as text, so a
+/// huge error page is neither downloaded in full nor held in memory.
+async fn error_message(mut response: Response) -> String {
+    let mut body = Vec::new();
+    while body.len() < MAX_ERROR_BODY {
+        match response.chunk().await {
+            Ok(Some(chunk)) => body.extend_from_slice(&chunk),
+            _ => break,
+        }
+    }
+
+    body.truncate(MAX_ERROR_BODY);
+    String::from_utf8_lossy(&body).into_owned()
+}
+
+/// Runs `op` over `items` with up to `max_concurrency` futures in flight and
+/// returns the results in input order.
+///
+/// Uses `buffer_unordered` so a slow item only occupies its own slot; the
+/// original order is restored afterwards from each item's index.
+async fn fan_out<I, T, F, Fut>(items: I, max_concurrency: usize, op: F) -> Vec<Result<T>>
+where
+    I: IntoIterator,
+    F: Fn(I::Item) -> Fut,
+    Fut: Future<Output = Result<T>>,
+{
+    let mut results: Vec<(usize, Result<T>)> = stream::iter(items.into_iter().enumerate())
+        .map(|(index, item)| {
+            let future = op(item);
+            async move { (index, future.await) }
+        })
+        .buffer_unordered(max_concurrency.max(1))
+        .collect()
+        .await;
+
+    results.sort_unstable_by_key(|(index, _)| *index);
+    results.into_iter().map(|(_, result)| result).collect()
+}
+
+const RETRY_BASE_DELAY: Duration = Duration::from_millis(100);
+const MAX_RETRY_DELAY: Duration = Duration::from_secs(5);
+
+fn is_retryable_status(status: StatusCode) -> bool {
+    matches!(
+        status,
+        StatusCode::BAD_GATEWAY | StatusCode::SERVICE_UNAVAILABLE | StatusCode::GATEWAY_TIMEOUT
+    )
+}
+
+fn object_metadata_from_headers(key: &str, headers: &HeaderMap) -> ObjectMetadata {
+    let mut object = ObjectMetadata {
+        key: key.to_string(),
+        size: 0,
+        content_type: None,
+        etag: String::new(),
+        last_modified: String::new(),
+        metadata: HashMap::new(),
+    };
+
+    // Single pass over the headers rather than a lookup per field
+    for (header_name, header_value) in headers.iter() {
+        let Ok(value) = header_value.to_str() else {
+            continue;
+        };
+
+        match header_name.as_str() {
+            "etag" => object.etag = value.to_string(),
+            "last-modified" => object.last_modified = value.to_string(),
+            "content-type" => object.content_type = Some(value.to_string()),
+            "content-length" => object.size = value.parse().unwrap_or(0),
+            name => {
+                // Custom metadata from x-object-meta-* headers
+                if let Some(meta_key) = name.strip_prefix("x-object-meta-") {
+                    object
+                        .metadata
+                        .insert(meta_key.to_string(), value.to_string());
+                }
+            }
+        }
+    }
+
+    object
 }
 
 impl ObjectStoreClient {
@@ -86,6 +346,8 @@ impl ObjectStoreClient {
         Self {
             client: Client::new(),
             base_url: base_url.into(),
+            max_retries: 0,
+            validate_names: false,
         }
     }
 
@@ -93,101 +355,180 @@ impl ObjectStoreClient {
         Self {
             client,
             base_url: base_url.into(),
+            max_retries: 0,
+            validate_names: false,
+        }
+    }
+
+    pub fn builder(base_url: impl Into<String>) -> ObjectStoreClientBuilder {
+        ObjectStoreClientBuilder {
+            base_url: base_url.into(),
+            timeout: None,
+            pool_max_idle_per_host: usize::MAX,
+            pool_idle_timeout: Duration::from_secs(90),
+            max_retries: 0,
+            http2_prior_knowledge: false,
+            validate_names: false,
         }
     }
 
+    async fn send(&self, request: RequestBuilder) -> Result<Response> {
+        let request = request.build()?;
+        let retries = if request.method().is_idempotent() {
+            self.max_retries
+        } else {
+            0
+        };
+
+        let mut delay = RETRY_BASE_DELAY;
+        for _ in 0..retries {
+            // Streaming bodies cannot be replayed
+            let Some(attempt) = request.try_clone() else {
+                break;
+            };
+
+            match self.client.execute(attempt).await {
+                Ok(response) if !is_retryable_status(response.status()) => return Ok(response),
+                Err(e) if !e.is_connect() && !e.is_timeout() => return Err(e.into()),
+                _ => {}
+            }
+
+            tokio::time::sleep(delay).await;
+            delay = (delay * 2).min(MAX_RETRY_DELAY);
+        }
+
+        Ok(self.client.execute(request).await?)
+    }
+
+    fn bucket_url(&self, bucket: &str) -> String {
+        format!(
+            "{}/buckets/{}",
+            self.base_url,
+            utf8_percent_encode(bucket, COMPONENT_ENCODE_SET)
+        )
+    }
+
+    fn object_url(&self, bucket: &str, route: &str, key: &str) -> Result<String> {
+        self.check_bucket_name(bucket)?;
+        if self.validate_names {
+            validate_object_key(key)?;
+        }
+
+        Ok(format!(
+            "{}/buckets/{}/{}/{}",
+            self.base_url,
+            utf8_percent_encode(bucket, COMPONENT_ENCODE_SET),
+            route,
+            utf8_percent_encode(key, KEY_ENCODE_SET)
+        ))
+    }
+
+    fn check_bucket_name(&self, name: &str) -> Result<()> {
+        if self.validate_names {
+            validate_bucket_name(name)?;
+        }
+        Ok(())
+    }
+
     pub async fn ping(&self) -> Result<()> {
         let url = format!("{}/ping", self.base_url);
-        let response = self.client.get(&url).send().await?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
-            StatusCode::OK => Ok(()),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::OK => {
+                // Drain the body so the connection goes back to the pool
+                response.bytes().await?;
+                Ok(())
+            }
+            _ => Err(Error::ServerError(error_message(response).await)),
+        }
+    }
+
+    /// Opens up to `connections` pooled keep-alive connections ahead of time.
+    ///
+    /// DNS resolution and the TCP/TLS handshakes happen here instead of on
+    /// the first real requests, which then reuse the warm connections.
+    pub async fn warm_up(&self, connections: usize) -> Result<()> {
+        if connections == 0 {
+            return Ok(());
         }
+
+        stream::iter(0..connections)
+            .map(|_| self.ping())
+            .buffer_unordered(connections)
+            .collect::<Vec<_>>()
+            .await
+            .into_iter()
+            .collect()
     }
 
     pub async fn create_bucket(&self, name: &str) -> Result<Bucket> {
+        self.check_bucket_name(name)?;
         let url = format!("{}/buckets", self.base_url);
         let req = CreateBucketRequest {
             name: name.to_string(),
         };
 
-        let response = self.client.post(&url).json(&req).send().await?;
+        let response = self.send(self.client.post(&url).json(&req)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
             StatusCode::CONFLICT => Err(Error::AlreadyExists(name.to_string())),
-            StatusCode::BAD_REQUEST => {
-                Err(Error::BadRequest(response.text().await.unwrap_or_default()))
-            }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::BAD_REQUEST => Err(Error::BadRequest(error_message(response).await)),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn upsert_bucket(&self, name: &str) -> Result<Bucket> {
+        self.check_bucket_name(name)?;
         let url = format!("{}/buckets", self.base_url);
         let req = CreateBucketRequest {
             name: name.to_string(),
         };
 
-        let response = self.client.put(&url).json(&req).send().await?;
+        let response = self.send(self.client.put(&url).json(&req)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
-            StatusCode::BAD_REQUEST => {
-                Err(Error::BadRequest(response.text().await.unwrap_or_default()))
-            }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::BAD_REQUEST => Err(Error::BadRequest(error_message(response).await)),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn get_bucket(&self, id: &str) -> Result<Bucket> {
-        let url = format!("{}/buckets/{}", self.base_url, id);
-        let response = self.client.get(&url).send().await?;
+        let url = self.bucket_url(id);
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
             StatusCode::NOT_FOUND => Err(Error::NotFound(id.to_string())),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn list_buckets(&self) -> Result<Vec<Bucket>> {
         let url = format!("{}/buckets", self.base_url);
-        let response = self.client.get(&url).send().await?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
             StatusCode::OK => {
                 let resp: ListBucketsResponse = response.json().await?;
                 Ok(resp.buckets)
             }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn delete_bucket(&self, name: &str) -> Result<()> {
-        let url = format!("{}/buckets/{}", self.base_url, name);
-        let response = self.client.delete(&url).send().await?;
+        self.check_bucket_name(name)?;
+        let url = self.bucket_url(name);
+        let response = self.send(self.client.delete(&url)).await?;
 
         match response.status() {
             StatusCode::NO_CONTENT => Ok(()),
             StatusCode::NOT_FOUND => Err(Error::NotFound(name.to_string())),
-            StatusCode::BAD_REQUEST => {
-                Err(Error::BadRequest(response.text().await.unwrap_or_default()))
-            }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::BAD_REQUEST => Err(Error::BadRequest(error_message(response).await)),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
@@ -199,193 +540,265 @@ impl ObjectStoreClient {
         content_type: Option<&str>,
         metadata: Option<HashMap<String, String>>,
     ) -> Result<ObjectMetadata> {
-        let url = format!("{}/buckets/{}/objects/{}", self.base_url, bucket, key);
-        let mut request = self.client.put(&url);
+        let metadata = match metadata {
+            Some(meta) => MetadataHeaders::new(&meta)?,
+            None => MetadataHeaders::default(),
+        };
+
+        self.put_object_with_headers(bucket, key, data, content_type, &metadata)
+            .await
+    }
+
+    /// Like [`put_object`](Self::put_object), but with metadata headers that
+    /// were encoded once up front and can be shared across many uploads.
+    pub async fn put_object_with_headers(
+        &self,
+        bucket: &str,
+        key: &str,
+        data: impl Into<Bytes>,
+        content_type: Option<&str>,
+        metadata: &MetadataHeaders,
+    ) -> Result<ObjectMetadata> {
+        self.put_object_stream(bucket, key, data.into(), content_type, metadata)
+            .await
+    }
+
+    /// Uploads an object from any [`Body`], such as an open
+    /// `tokio::fs::File` or a stream of chunks.
+    ///
+    /// The body is sent as it is read, so large uploads never have to be
+    /// held in memory. Streamed bodies cannot be replayed and are therefore
+    /// never retried.
+    pub async fn put_object_stream(
+        &self,
+        bucket: &str,
+        key: &str,
+        body: impl Into<Body>,
+        content_type: Option<&str>,
+        metadata: &MetadataHeaders,
+    ) -> Result<ObjectMetadata> {
+        let url = self.object_url(bucket, "objects", key)?;
+        let mut request = self.client.put(&url).headers(metadata.headers.clone());
 
         if let Some(ct) = content_type {
             request = request.header("content-type", ct);
         }
 
-        if let Some(meta) = metadata {
-            for (k, v) in meta {
-                request = request.header(format!("x-object-meta-{}", k), v);
-            }
-        }
-
-        let response = request.body(data.into()).send().await?;
+        let response = self.send(request.body(body)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
             StatusCode::NOT_FOUND => Err(Error::NotFound(bucket.to_string())),
-            StatusCode::BAD_REQUEST => {
-                Err(Error::BadRequest(response.text().await.unwrap_or_default()))
-            }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::BAD_REQUEST => Err(Error::BadRequest(error_message(response).await)),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn get_object(&self, bucket: &str, key: &str) -> Result<ObjectData> {
-        let url = format!("{}/buckets/{}/objects/{}", self.base_url, bucket, key);
-        let response = self.client.get(&url).send().await?;
+        let stream = self.get_object_stream(bucket, key).await?;
+        let data = stream.response.bytes().await?;
+
+        Ok(ObjectData {
+            metadata: stream.metadata,
+            data,
+        })
+    }
+
+    /// Downloads an object unless it still has the given `etag`.
+    ///
+    /// Returns `None` when the server answers 304 Not Modified, so callers
+    /// holding a cached copy skip transferring the body again.
+    pub async fn get_object_if_none_match(
+        &self,
+        bucket: &str,
+        key: &str,
+        etag: &str,
+    ) -> Result<Option<ObjectData>> {
+        let url = self.object_url(bucket, "objects", key)?;
+        let request = self
+            .client
+            .get(&url)
+            .header("if-none-match", format!("\"{}\"", etag));
+        let response = self.send(request).await?;
 
         match response.status() {
+            StatusCode::NOT_MODIFIED => Ok(None),
             StatusCode::OK => {
-                let etag = response
-                    .headers()
-                    .get("etag")
-                    .and_then(|v| v.to_str().ok())
-                    .unwrap_or("")
-                    .to_string();
-
-                let last_modified = response
-                    .headers()
-                    .get("last-modified")
-                    .and_then(|v| v.to_str().ok())
-                    .unwrap_or("")
-                    .to_string();
-
-                let content_type = response
-                    .headers()
-                    .get("content-type")
-                    .and_then(|v| v.to_str().ok())
-                    .map(|s| s.to_string());
-
-                let size = response
-                    .headers()
-                    .get("content-length")
-                    .and_then(|v| v.to_str().ok())
-                    .and_then(|s| s.parse().ok())
-                    .unwrap_or(0);
-
-                // Extract custom metadata from x-object-meta-* headers
-                let mut metadata = HashMap::new();
-                for (header_name, header_value) in response.headers().iter() {
-                    if let Some(meta_key) = header_name.as_str().strip_prefix("x-object-meta-") {
-                        if let Ok(meta_value) = header_value.to_str() {
-                            metadata.insert(meta_key.to_string(), meta_value.to_string());
-                        }
-                    }
-                }
-
+                let metadata = object_metadata_from_headers(key, response.headers());
                 let data = response.bytes().await?;
 
-                Ok(ObjectData {
-                    metadata: ObjectMetadata {
-                        key: key.to_string(),
-                        size,
-                        content_type,
-                        etag,
-                        last_modified,
-                        metadata,
-                    },
-                    data,
-                })
+                Ok(Some(ObjectData { metadata, data }))
             }
             StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
-    pub async fn head_object(&self, bucket: &str, key: &str) -> Result<ObjectMetadata> {
-        let url = format!("{}/buckets/{}/objects/{}", self.base_url, bucket, key);
-        let response = self.client.head(&url).send().await?;
+    /// Starts downloading an object without buffering its body.
+    ///
+    /// The returned [`ObjectStream`] yields the body chunk by chunk as it
+    /// arrives, so large objects never have to fit in memory at once.
+    pub async fn get_object_stream(&self, bucket: &str, key: &str) -> Result<ObjectStream> {
+        let url = self.object_url(bucket, "objects", key)?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
-            StatusCode::OK => {
-                let etag = response
-                    .headers()
-                    .get("etag")
-                    .and_then(|v| v.to_str().ok())
-                    .unwrap_or("")
-                    .to_string();
-
-                let last_modified = response
-                    .headers()
-                    .get("last-modified")
-                    .and_then(|v| v.to_str().ok())
-                    .unwrap_or("")
-                    .to_string();
-
-                let content_type = response
-                    .headers()
-                    .get("content-type")
-                    .and_then(|v| v.to_str().ok())
-                    .map(|s| s.to_string());
-
-                let size = response
-                    .headers()
-                    .get("content-length")
-                    .and_then(|v| v.to_str().ok())
-                    .and_then(|s| s.parse().ok())
-                    .unwrap_or(0);
-
-                // Extract custom metadata from x-object-meta-* headers
-                let mut metadata = HashMap::new();
-                for (header_name, header_value) in response.headers().iter() {
-                    if let Some(meta_key) = header_name.as_str().strip_prefix("x-object-meta-") {
-                        if let Ok(meta_value) = header_value.to_str() {
-                            metadata.insert(meta_key.to_string(), meta_value.to_string());
-                        }
-                    }
-                }
+            StatusCode::OK => Ok(ObjectStream {
+                metadata: object_metadata_from_headers(key, response.headers()),
+                response,
+            }),
+            StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
+            _ => Err(Error::ServerError(error_message(response).await)),
+        }
+    }
 
-                Ok(ObjectMetadata {
-                    key: key.to_string(),
-                    size,
-                    content_type,
-                    etag,
-                    last_modified,
-                    metadata,
-                })
-            }
+    /// Downloads an object straight into `writer`, one chunk at a time.
+    pub async fn get_object_to<W>(
+        &self,
+        bucket: &str,
+        key: &str,
+        writer: &mut W,
+    ) -> Result<ObjectMetadata>
+    where
+        W: AsyncWrite + Unpin + ?Sized,
+    {
+        let mut stream = self.get_object_stream(bucket, key).await?;
+
+        while let Some(chunk) = stream.chunk().await? {
+            writer.write_all(&chunk).await?;
+        }
+        writer.flush().await?;
+
+        Ok(stream.metadata)
+    }
+
+    pub async fn head_object(&self, bucket: &str, key: &str) -> Result<ObjectMetadata> {
+        let url = self.object_url(bucket, "objects", key)?;
+        let response = self.send(self.client.head(&url)).await?;
+
+        match response.status() {
+            StatusCode::OK => Ok(object_metadata_from_headers(key, response.headers())),
             StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn get_object_info(&self, bucket: &str, key: &str) -> Result<ObjectMetadata> {
-        let url = format!("{}/buckets/{}/object-info/{}", self.base_url, bucket, key);
-        let response = self.client.get(&url).send().await?;
+        let url = self.object_url(bucket, "object-info", key)?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
             StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
     pub async fn delete_object(&self, bucket: &str, key: &str) -> Result<()> {
-        let url = format!("{}/buckets/{}/objects/{}", self.base_url, bucket, key);
-        let response = self.client.delete(&url).send().await?;
+        let url = self.object_url(bucket, "objects", key)?;
+        let response = self.send(self.client.delete(&url)).await?;
 
         match response.status() {
             StatusCode::NO_CONTENT => Ok(()),
             StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
+    /// Uploads many objects to `bucket`, keeping up to `max_concurrency`
+    /// requests in flight on the shared connection pool.
+    ///
+    /// Results are returned in the same order as `items`; one failed upload
+    /// does not stop the others.
+    pub async fn put_many<I, K, D>(
+        &self,
+        bucket: &str,
+        items: I,
+        metadata: &MetadataHeaders,
+        max_concurrency: usize,
+    ) -> Vec<Result<ObjectMetadata>>
+    where
+        I: IntoIterator<Item = (K, D)>,
+        K: AsRef<str>,
+        D: Into<Bytes>,
+    {
+        fan_out(items, max_concurrency, |(key, data)| async move {
+            self.put_object_with_headers(bucket, key.as_ref(), data, None, metadata)
+                .await
+        })
+        .await
+    }
+
+    /// Downloads many objects from `bucket`, keeping up to `max_concurrency`
+    /// requests in flight. Results are returned in the same order as `keys`.
+    pub async fn get_many<I, K>(
+        &self,
+        bucket: &str,
+        keys: I,
+        max_concurrency: usize,
+    ) -> Vec<Result<ObjectData>>
+    where
+        I: IntoIterator<Item = K>,
+        K: AsRef<str>,
+    {
+        fan_out(keys, max_concurrency, |key| async move {
+            self.get_object(bucket, key.as_ref()).await
+        })
+        .await
+    }
+
+    /// Fetches metadata for many objects in `bucket`, keeping up to
+    /// `max_concurrency` HEAD requests in flight. Results are returned in the
+    /// same order as `keys`.
+    pub async fn head_many<I, K>(
+        &self,
+        bucket: &str,
+        keys: I,
+        max_concurrency: usize,
+    ) -> Vec<Result<ObjectMetadata>>
+    where
+        I: IntoIterator<Item = K>,
+        K: AsRef<str>,
+    {
+        fan_out(keys, max_concurrency, |key| async move {
+            self.head_object(bucket, key.as_ref()).await
+        })
+        .await
+    }
+
+    /// Deletes many objects from `bucket`, keeping up to `max_concurrency`
+    /// requests in flight. Results are returned in the same order as `keys`.
+    pub async fn delete_many<I, K>(
+        &self,
+        bucket: &str,
+        keys: I,
+        max_concurrency: usize,
+    ) -> Vec<Result<()>>
+    where
+        I: IntoIterator<Item = K>,
+        K: AsRef<str>,
+    {
+        fan_out(keys, max_concurrency, |key| async move {
+            self.delete_object(bucket, key.as_ref()).await
+        })
+        .await
+    }
+
     pub async fn list_objects(
         &self,
         bucket: &str,
         prefix: Option<&str>,
         max_keys: Option<usize>,
     ) -> Result<Vec<ObjectMetadata>> {
-        let mut url = format!("{}/buckets/{}/objects", self.base_url, bucket);
+        self.check_bucket_name(bucket)?;
+        let mut url = format!("{}/objects", self.bucket_url(bucket));
         let mut params = vec![];
 
         if let Some(p) = prefix {
-            params.push(format!("prefix={}", p));
+            params.push(format!(
+                "prefix={}",
+                utf8_percent_encode(p, COMPONENT_ENCODE_SET)
+            ));
         }
         if let Some(m) = max_keys {
             params.push(format!("max_keys={}", m));
@@ -396,7 +809,7 @@ impl ObjectStoreClient {
             url.push_str(&params.join("&"));
         }
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
             StatusCode::OK => {
@@ -404,9 +817,7 @@ impl ObjectStoreClient {
                 Ok(resp.objects)
             }
             StatusCode::NOT_FOUND => Err(Error::NotFound(bucket.to_string())),
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 
@@ -417,7 +828,7 @@ impl ObjectStoreClient {
         expiration_secs: Option<u64>,
         purpose: Option<PublicUrlPurpose>,
     ) -> Result<PublicUrlResponse> {
-        let mut url = format!("{}/buckets/{}/public-url/{}", self.base_url, bucket, key);
+        let mut url = self.object_url(bucket, "public-url", key)?;
         let mut params = vec![];
 
         if let Some(exp) = expiration_secs {
@@ -437,17 +848,13 @@ impl ObjectStoreClient {
             url.push_str(&params.join("&"));
         }
 
-        let response = self.client.get(&url).send().await?;
+        let response = self.send(self.client.get(&url)).await?;
 
         match response.status() {
             StatusCode::OK => Ok(response.json().await?),
             StatusCode::NOT_FOUND => Err(Error::NotFound(format!("{}/{}", bucket, key))),
-            StatusCode::BAD_REQUEST => {
-                Err(Error::BadRequest(response.text().await.unwrap_or_default()))
-            }
-            _ => Err(Error::ServerError(
-                response.text().await.unwrap_or_default(),
-            )),
+            StatusCode::BAD_REQUEST => Err(Error::BadRequest(error_message(response).await)),
+            _ => Err(Error::ServerError(error_message(response).await)),
         }
     }
 }
@@ -463,6 +870,150 @@ mod tests {
         assert_eq!(client.base_url, "http://localhost:8080");
     }
 
+    #[tokio::test]
+    async fn test_builder_retries_idempotent_requests() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/buckets")
+            .with_status(503)
+            .with_body("Service unavailable")
+            .expect(3)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::builder(server.url())
+            .max_retries(2)
+            .build()
+            .unwrap();
+        let result = client.list_buckets().await;
+
+        assert!(matches!(result.unwrap_err(), Error::ServerError(_)));
+        _m.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_builder_does_not_retry_post() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("POST", "/buckets")
+            .with_status(503)
+            .with_body("Service unavailable")
+            .expect(1)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::builder(server.url())
+            .max_retries(2)
+            .build()
+            .unwrap();
+        let result = client.create_bucket("test-bucket").await;
+
+        assert!(result.is_err());
+        _m.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_builder_validates_names() {
+        // No mocks: invalid names must be rejected before any request is sent
+        let server = Server::new_async().await;
+        let client = ObjectStoreClient::builder(server.url())
+            .validate_names(true)
+            .build()
+            .unwrap();
+
+        let result = client.create_bucket("Bad_Bucket").await;
+        assert!(matches!(result.unwrap_err(), Error::BadRequest(_)));
+
+        let result = client.get_object("test-bucket", "../escape").await;
+        assert!(matches!(result.unwrap_err(), Error::BadRequest(_)));
+    }
+
+    #[test]
+    fn test_validate_bucket_name() {
+        assert!(validate_bucket_name("my-bucket").is_ok());
+        assert!(validate_bucket_name("abc").is_ok());
+        assert!(validate_bucket_name("ab").is_err());
+        assert!(validate_bucket_name("My-Bucket").is_err());
+        assert!(validate_bucket_name("-bucket").is_err());
+        assert!(validate_bucket_name("bucket-").is_err());
+        assert!(validate_bucket_name("bucket_name").is_err());
+    }
+
+    #[test]
+    fn test_validate_object_key() {
+        assert!(validate_object_key("dir/file.txt").is_ok());
+        assert!(validate_object_key("").is_err());
+        assert!(validate_object_key("/absolute").is_err());
+        assert!(validate_object_key("a/../b").is_err());
+        assert!(validate_object_key(".bucket").is_err());
+    }
+
+    #[tokio::test]
+    async fn test_concurrent_requests_on_cloned_client() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock(
+                "HEAD",
+                mockito::Matcher::Regex(r"^/buckets/test-bucket/objects/key-\d+$".into()),
+            )
+            .with_status(200)
+            .with_header("content-length", "13")
+            .with_header("etag", "abc123")
+            .expect(8)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let mut tasks = tokio::task::JoinSet::new();
+        for i in 0..8 {
+            let client = client.clone();
+            tasks.spawn(async move {
+                client
+                    .head_object("test-bucket", &format!("key-{}", i))
+                    .await
+            });
+        }
+
+        while let Some(result) = tasks.join_next().await {
+            assert_eq!(result.unwrap().unwrap().etag, "abc123");
+        }
+        _m.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_warm_up() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/ping")
+            .with_status(200)
+            .with_body("OK")
+            .expect(4)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        client.warm_up(4).await.unwrap();
+
+        _m.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_warm_up_zero_sends_nothing() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/ping")
+            .with_status(200)
+            .with_body("OK")
+            .expect(0)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        client.warm_up(0).await.unwrap();
+
+        _m.assert_async().await;
+    }
+
     #[tokio::test]
     async fn test_create_bucket() {
         let mut server = Server::new_async().await;
@@ -522,6 +1073,25 @@ mod tests {
         assert_eq!(buckets[1].name, "bucket2");
     }
 
+    #[tokio::test]
+    async fn test_error_message_is_capped() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/buckets")
+            .with_status(500)
+            .with_body("x".repeat(MAX_ERROR_BODY * 4))
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let result = client.list_buckets().await;
+
+        match result.unwrap_err() {
+            Error::ServerError(message) => assert_eq!(message.len(), MAX_ERROR_BODY),
+            e => panic!("unexpected error: {}", e),
+        }
+    }
+
     #[tokio::test]
     async fn test_delete_bucket() {
         let mut server = Server::new_async().await;
@@ -586,6 +1156,78 @@ mod tests {
         assert_eq!(obj.etag, "abc123");
     }
 
+    #[tokio::test]
+    async fn test_put_object_with_headers() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock(
+                "PUT",
+                mockito::Matcher::Regex(r"^/buckets/test-bucket/objects/key-\d$".into()),
+            )
+            .match_header("x-object-meta-author", "alice")
+            .with_status(200)
+            .with_header("content-type", "application/json")
+            .with_body(r#"{"key":"key","size":2,"etag":"abc123","last_modified":"2024-01-01T00:00:00Z","metadata":{"author":"alice"}}"#)
+            .expect(2)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let mut metadata = HashMap::new();
+        metadata.insert("author".to_string(), "alice".to_string());
+        let headers = MetadataHeaders::new(&metadata).unwrap();
+
+        for key in ["key-1", "key-2"] {
+            client
+                .put_object_with_headers("test-bucket", key, "hi", None, &headers)
+                .await
+                .unwrap();
+        }
+
+        _m.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_put_object_stream() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("PUT", "/buckets/test-bucket/objects/test-key")
+            .match_body("Hello, World!")
+            .with_status(200)
+            .with_header("content-type", "application/json")
+            .with_body(r#"{"key":"test-key","size":13,"etag":"abc123","last_modified":"2024-01-01T00:00:00Z","metadata":{}}"#)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let chunks: Vec<std::io::Result<&'static str>> = vec![Ok("Hello, "), Ok("World!")];
+        let body = Body::wrap_stream(stream::iter(chunks));
+
+        let obj = client
+            .put_object_stream(
+                "test-bucket",
+                "test-key",
+                body,
+                Some("text/plain"),
+                &MetadataHeaders::default(),
+            )
+            .await
+            .unwrap();
+
+        assert_eq!(obj.size, 13);
+        _m.assert_async().await;
+    }
+
+    #[test]
+    fn test_metadata_headers_rejects_invalid_key() {
+        let mut metadata = HashMap::new();
+        metadata.insert("bad key".to_string(), "value".to_string());
+
+        let result = MetadataHeaders::new(&metadata);
+
+        assert!(matches!(result.unwrap_err(), Error::BadRequest(_)));
+    }
+
     #[tokio::test]
     async fn test_get_object() {
         let mut server = Server::new_async().await;
@@ -626,6 +1268,93 @@ mod tests {
         assert!(matches!(result.unwrap_err(), Error::NotFound(_)));
     }
 
+    #[tokio::test]
+    async fn test_get_object_if_none_match() {
+        let mut server = Server::new_async().await;
+        let _fresh = server
+            .mock("GET", "/buckets/test-bucket/objects/test-key")
+            .match_header("if-none-match", "\"abc123\"")
+            .with_status(304)
+            .with_header("etag", "abc123")
+            .create_async()
+            .await;
+        let _stale = server
+            .mock("GET", "/buckets/test-bucket/objects/test-key")
+            .match_header("if-none-match", "\"old\"")
+            .with_status(200)
+            .with_header("etag", "abc123")
+            .with_body("Hello, World!")
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+
+        let unchanged = client
+            .get_object_if_none_match("test-bucket", "test-key", "abc123")
+            .await
+            .unwrap();
+        assert!(unchanged.is_none());
+
+        let changed = client
+            .get_object_if_none_match("test-bucket", "test-key", "old")
+            .await
+            .unwrap()
+            .unwrap();
+        assert_eq!(changed.metadata.etag, "abc123");
+        assert_eq!(changed.data, Bytes::from("Hello, World!"));
+    }
+
+    #[tokio::test]
+    async fn test_get_object_stream() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/buckets/test-bucket/objects/test-key")
+            .with_status(200)
+            .with_header("content-type", "text/plain")
+            .with_header("etag", "abc123")
+            .with_body("Hello, World!")
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let mut stream = client
+            .get_object_stream("test-bucket", "test-key")
+            .await
+            .unwrap();
+
+        let mut data = Vec::new();
+        while let Some(chunk) = stream.chunk().await.unwrap() {
+            data.extend_from_slice(&chunk);
+        }
+
+        assert_eq!(stream.metadata.etag, "abc123");
+        assert_eq!(data, b"Hello, World!");
+    }
+
+    #[tokio::test]
+    async fn test_get_object_to() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock("GET", "/buckets/test-bucket/objects/test-key")
+            .with_status(200)
+            .with_header("content-type", "text/plain")
+            .with_header("etag", "abc123")
+            .with_body("Hello, World!")
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let mut sink = Vec::new();
+        let metadata = client
+            .get_object_to("test-bucket", "test-key", &mut sink)
+            .await
+            .unwrap();
+
+        assert_eq!(metadata.key, "test-key");
+        assert_eq!(metadata.etag, "abc123");
+        assert_eq!(sink, b"Hello, World!");
+    }
+
     #[tokio::test]
     async fn test_head_object() {
         let mut server = Server::new_async().await;
@@ -647,6 +1376,26 @@ mod tests {
         assert_eq!(obj.etag, "abc123");
     }
 
+    #[tokio::test]
+    async fn test_object_key_is_percent_encoded() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock(
+                "DELETE",
+                "/buckets/test-bucket/objects/dir/my%20file%3F.txt",
+            )
+            .with_status(204)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let result = client
+            .delete_object("test-bucket", "dir/my file?.txt")
+            .await;
+
+        assert!(result.is_ok());
+    }
+
     #[tokio::test]
     async fn test_delete_object() {
         let mut server = Server::new_async().await;
@@ -662,6 +1411,148 @@ mod tests {
         assert!(result.is_ok());
     }
 
+    #[tokio::test]
+    async fn test_get_many() {
+        let mut server = Server::new_async().await;
+        let _a = server
+            .mock("GET", "/buckets/test-bucket/objects/a")
+            .with_status(200)
+            .with_header("etag", "etag-a")
+            .with_body("aaa")
+            .create_async()
+            .await;
+        let _b = server
+            .mock("GET", "/buckets/test-bucket/objects/b")
+            .with_status(404)
+            .with_body("Object not found")
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let results = client.get_many("test-bucket", ["a", "b"], 4).await;
+
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0].as_ref().unwrap().data, Bytes::from("aaa"));
+        assert!(matches!(results[1], Err(Error::NotFound(_))));
+    }
+
+    #[tokio::test]
+    async fn test_head_many() {
+        let mut server = Server::new_async().await;
+        let _a = server
+            .mock("HEAD", "/buckets/test-bucket/objects/a")
+            .with_status(200)
+            .with_header("content-type", "text/plain")
+            .with_header("content-length", "3")
+            .with_header("etag", "etag-a")
+            .with_header("x-object-meta-author", "alice")
+            .create_async()
+            .await;
+        let _b = server
+            .mock("HEAD", "/buckets/test-bucket/objects/b")
+            .with_status(200)
+            .with_header("content-length", "5")
+            .with_header("etag", "etag-b")
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let results = client.head_many("test-bucket", ["a", "b"], 4).await;
+
+        let a = results[0].as_ref().unwrap();
+        assert_eq!(a.key, "a");
+        assert_eq!(a.size, 3);
+        assert_eq!(a.etag, "etag-a");
+        assert_eq!(a.content_type.as_deref(), Some("text/plain"));
+        assert_eq!(a.metadata.get("author").map(String::as_str), Some("alice"));
+
+        let b = results[1].as_ref().unwrap();
+        assert_eq!(b.size, 5);
+        assert_eq!(b.etag, "etag-b");
+        assert!(b.metadata.is_empty());
+    }
+
+    #[tokio::test(flavor = "multi_thread")]
+    async fn test_get_many_does_not_stall_behind_slow_item() {
+        use std::sync::atomic::{AtomicUsize, Ordering};
+        use std::sync::Arc;
+
+        let mut server = Server::new_async().await;
+        let fast_hits = Arc::new(AtomicUsize::new(0));
+
+        // The slow object only finishes once every fast object has been
+        // requested, which requires the other slots to keep turning over.
+        let slow_hits = fast_hits.clone();
+        let _slow = server
+            .mock("GET", "/buckets/test-bucket/objects/slow")
+            .with_status(200)
+            .with_chunked_body(move |w| {
+                let deadline = std::time::Instant::now() + std::time::Duration::from_secs(5);
+                while slow_hits.load(Ordering::SeqCst) < 4 && std::time::Instant::now() < deadline {
+                    std::thread::sleep(std::time::Duration::from_millis(10));
+                }
+                let body: &[u8] = if slow_hits.load(Ordering::SeqCst) >= 4 {
+                    b"unblocked"
+                } else {
+                    b"stalled"
+                };
+                w.write_all(body)
+            })
+            .create_async()
+            .await;
+
+        let counter = fast_hits.clone();
+        let _fast = server
+            .mock(
+                "GET",
+                mockito::Matcher::Regex(r"^/buckets/test-bucket/objects/fast-\d$".into()),
+            )
+            .with_status(200)
+            .with_body_from_request(move |_| {
+                counter.fetch_add(1, Ordering::SeqCst);
+                b"fast".to_vec()
+            })
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let results = client
+            .get_many(
+                "test-bucket",
+                ["slow", "fast-1", "fast-2", "fast-3", "fast-4"],
+                2,
+            )
+            .await;
+
+        assert_eq!(results.len(), 5);
+        assert_eq!(results[0].as_ref().unwrap().data, Bytes::from("unblocked"));
+        for result in &results[1..] {
+            assert_eq!(result.as_ref().unwrap().data, Bytes::from("fast"));
+        }
+    }
+
+    #[tokio::test]
+    async fn test_delete_many() {
+        let mut server = Server::new_async().await;
+        let _m = server
+            .mock(
+                "DELETE",
+                mockito::Matcher::Regex(r"^/buckets/test-bucket/objects/key-\d$".into()),
+            )
+            .with_status(204)
+            .expect(3)
+            .create_async()
+            .await;
+
+        let client = ObjectStoreClient::new(server.url());
+        let results = client
+            .delete_many("test-bucket", ["key-1", "key-2", "key-3"], 2)
+            .await;
+
+        assert!(results.iter().all(|r| r.is_ok()));
+        _m.assert_async().await;
+    }
+
     #[tokio::test]
     async fn test_list_objects() {
         let mut server = Server::new_async().await;
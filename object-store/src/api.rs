@@ -177,7 +177,24 @@ pub async fn put_object(
 pub async fn get_object(
     State(service): State<SharedService>,
     Path((bucket, key)): Path<(String, String)>,
+    request_headers: HeaderMap,
 ) -> ServiceResult<Response> {
+    // Conditional GET: answer from metadata alone when the caller's copy is current
+    if let Some(if_none_match) = request_headers
+        .get("if-none-match")
+        .and_then(|v| v.to_str().ok())
+    {
+        let metadata = service.head_object(&bucket, &key).await?;
+
+        if etag_matches(if_none_match, &metadata.etag) {
+            let mut headers = HeaderMap::new();
+            if let Ok(etag) = metadata.etag.parse() {
+                headers.insert("etag", etag);
+            }
+            return Ok((StatusCode::NOT_MODIFIED, headers).into_response());
+        }
+    }
+
     let obj_data = service.get_object(&bucket, &key).await?;
 
     let mut headers = HeaderMap::new();
@@ -232,6 +249,18 @@ pub async fn get_object(
     Ok((headers, body).into_response())
 }
 
+fn etag_matches(if_none_match: &str, etag: &str) -> bool {
+    let etag = etag.trim_matches('"');
+    if_none_match.split(',').any(|candidate| {
+        let candidate = candidate.trim();
+        candidate == "*"
+            || candidate
+                .trim_start_matches("W/")
+                .trim_matches('"')
+                .eq(etag)
+    })
+}
+
 pub async fn get_object_info(
     State(service): State<SharedService>,
     Path((bucket, key)): Path<(String, String)>,
@@ -3,6 +3,7 @@ use axum::Router;
 use std::sync::Arc;
 use std::time::Duration;
 use tower::ServiceBuilder;
+use tower_http::compression::CompressionLayer;
 use tower_http::cors::CorsLayer;
 use tower_http::timeout::TimeoutLayer;
 use tower_http::trace::TraceLayer;
@@ -10,20 +11,25 @@ use tower_http::trace::TraceLayer;
 use crate::api::*;
 use crate::service::ObjectStoreService;
 
+/// Only JSON listings are compressed. Object bodies are sent as stored so that
+/// `content-length` keeps reporting the object size.
 pub fn create_router(service: Arc<ObjectStoreService>) -> Router {
     Router::new()
         .route("/health", get(health_check))
         .route("/ping", get(health_check))
         .route("/buckets", post(create_bucket))
         .route("/buckets", put(upsert_bucket))
-        .route("/buckets", get(list_buckets))
+        .route("/buckets", get(list_buckets).layer(CompressionLayer::new()))
         .route("/buckets/:bucket", get(get_bucket_by_id))
         .route("/buckets/:bucket", delete(delete_bucket))
         .route("/buckets/:bucket/objects/*key", put(put_object))
         .route("/buckets/:bucket/objects/*key", get(get_object))
         .route("/buckets/:bucket/objects/*key", head(head_object))
         .route("/buckets/:bucket/objects/*key", delete(delete_object))
-        .route("/buckets/:bucket/objects", get(list_objects))
+        .route(
+            "/buckets/:bucket/objects",
+            get(list_objects).layer(CompressionLayer::new()),
+        )
         .route("/buckets/:bucket/object-info/*key", get(get_object_info))
         .route("/buckets/:bucket/public-url/*key", get(get_public_url))
         .layer(
@@ -278,6 +278,59 @@ async fn test_list_objects() {
     assert_eq!(json["objects"].as_array().unwrap().len(), 1);
 }
 
+#[tokio::test]
+async fn test_list_objects_compressed() {
+    let (service, _temp_dir) = setup_test_service().await;
+    let app = object_store::router::create_router(service.clone());
+
+    service.create_bucket("test-bucket").await.unwrap();
+    let data = b"Hello, World!".to_vec();
+    let stream: object_store_backends::ByteStream =
+        Box::pin(stream::once(async move { Ok(Bytes::from(data)) }));
+    service
+        .put_object(
+            "test-bucket",
+            "test.txt",
+            stream,
+            Some("text/plain".to_string()),
+            Default::default(),
+        )
+        .await
+        .unwrap();
+
+    // Listings are compressed when the client accepts it
+    let response = app
+        .clone()
+        .oneshot(
+            Request::builder()
+                .uri("/buckets/test-bucket/objects")
+                .header("accept-encoding", "gzip")
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), StatusCode::OK);
+    assert_eq!(response.headers().get("content-encoding").unwrap(), "gzip");
+
+    // Object bodies are never compressed
+    let response = app
+        .oneshot(
+            Request::builder()
+                .uri("/buckets/test-bucket/objects/test.txt")
+                .header("accept-encoding", "gzip")
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), StatusCode::OK);
+    assert!(response.headers().get("content-encoding").is_none());
+    assert_eq!(response.headers().get("content-length").unwrap(), "13");
+}
+
 #[tokio::test]
 async fn test_head_object() {
     let (service, _temp_dir) = setup_test_service().await;
@@ -319,6 +372,105 @@ async fn test_head_object() {
     );
 }
 
+#[tokio::test]
+async fn test_get_object_if_none_match() {
+    let (service, _temp_dir) = setup_test_service().await;
+    let app = object_store::router::create_router(service.clone());
+
+    // Create bucket and put object
+    service.create_bucket("test-bucket").await.unwrap();
+    let data = b"Hello, World!".to_vec();
+    let stream: object_store_backends::ByteStream =
+        Box::pin(stream::once(async move { Ok(Bytes::from(data)) }));
+    let metadata = service
+        .put_object(
+            "test-bucket",
+            "test.txt",
+            stream,
+            Some("text/plain".to_string()),
+            Default::default(),
+        )
+        .await
+        .unwrap();
+
+    // Matching etag: no body is sent
+    let response = app
+        .clone()
+        .oneshot(
+            Request::builder()
+                .uri("/buckets/test-bucket/objects/test.txt")
+                .header("if-none-match", format!("\"{}\"", metadata.etag))
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), StatusCode::NOT_MODIFIED);
+    assert_eq!(
+        response.headers().get("etag").unwrap(),
+        metadata.etag.as_str()
+    );
+    let body = axum::body::to_bytes(response.into_body(), usize::MAX)
+        .await
+        .unwrap();
+    assert!(body.is_empty());
+
+    // Stale etag: full object is returned
+    let response = app
+        .oneshot(
+            Request::builder()
+                .uri("/buckets/test-bucket/objects/test.txt")
+                .header("if-none-match", "\"stale\"")
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), StatusCode::OK);
+    let body = axum::body::to_bytes(response.into_body(), usize::MAX)
+        .await
+        .unwrap();
+    assert_eq!(&body[..], b"Hello, World!");
+}
+
+#[tokio::test]
+async fn test_http2_prior_knowledge() {
+    let (service, _temp_dir) = setup_test_service().await;
+    let app = object_store::router::create_router(service.clone());
+
+    let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+    let addr = listener.local_addr().unwrap();
+    tokio::spawn(async move { axum::serve(listener, app).await.unwrap() });
+
+    service.create_bucket("test-bucket").await.unwrap();
+
+    // Same transport settings as the Rust client's `http2_prior_knowledge()`
+    let client = reqwest::Client::builder()
+        .http2_prior_knowledge()
+        .build()
+        .unwrap();
+    let url = format!("http://{}/buckets/test-bucket/objects/test.txt", addr);
+
+    let response = client
+        .put(&url)
+        .header("content-type", "text/plain")
+        .body("Hello, World!")
+        .send()
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), reqwest::StatusCode::OK);
+    assert_eq!(response.version(), reqwest::Version::HTTP_2);
+
+    let response = client.get(&url).send().await.unwrap();
+
+    assert_eq!(response.status(), reqwest::StatusCode::OK);
+    assert_eq!(response.version(), reqwest::Version::HTTP_2);
+    assert_eq!(&response.bytes().await.unwrap()[..], b"Hello, World!");
+}
+
 #[tokio::test]
 async fn test_invalid_bucket_name() {
     let (service, _temp_dir) = setup_test_service().await;